@@ -30,7 +30,7 @@ from coyaml._internal.node import YNode
 from coyaml._internal.registry import YRegistry
 from coyaml.sources.base import YSource
 from coyaml.sources.env import EnvFileSource
-from coyaml.sources.yaml import YamlFileSource
+from coyaml.sources.yaml import YamlFileSource, YamlStringSource
 from coyaml.utils.merge import deep_merge
 
 __all__ = [
@@ -39,6 +39,7 @@ __all__ = [
     'YRegistry',
     'YSource',
     'YamlFileSource',
+    'YamlStringSource',
     'EnvFileSource',
     'deep_merge',
     'YConfig',  # Legacy
@@ -4,12 +4,20 @@ import re
 from typing import Any
 
 import yaml
-from dotenv import load_dotenv
 
-from coyaml._internal.node import YNode
+try:  # Use libyaml's C loader when PyYAML is built with it (much faster parsing)
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+from dotenv import dotenv_values
+
+from coyaml._internal.node import YNode, _split_path, _walk_parts
 
 # Pattern for finding variable names
-TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):(.+?)}}')
+# '[^}]+' cannot backtrack, unlike a lazy '.+?', so malformed or very
+# long strings scan in linear time.
+TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):([^}]+)}}')
 
 
 class YConfig(YNode):
@@ -18,6 +26,8 @@ class YConfig(YNode):
     Inherits YNode functionality and adds methods for working with data sources.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: dict[str, Any] | None = None) -> None:
         """
         Initialize YAML configuration.
@@ -34,32 +44,32 @@ class YConfig(YNode):
 
         :param file_path: Path to YAML file.
         """
-        with open(file_path, 'rb') as file:  # Changed to binary mode
-            binary_content = file.read()
-            try:
-                text_content = binary_content.decode('utf-8')
-            except UnicodeDecodeError as e:
-                raise UnicodeDecodeError(
-                    'utf-8',  # encoding
-                    binary_content,  # object
-                    e.start,  # start
-                    e.end,  # end
-                    f'Error decoding file {file_path}: {e}',
-                ) from e
-            config = yaml.safe_load(text_content)
+        # Text mode decodes through the io layer's fast UTF-8 path; invalid
+        # input raises UnicodeDecodeError with full context already.
+        with open(file_path, encoding='utf-8') as file:
+            config = yaml.load(file.read(), Loader=_SafeLoader)  # noqa: S506
             self._data.update(config)
 
-    def add_env_source(self, file_path: str | None = None) -> None:
+    def add_env_source(self, file_path: str | None = None, include_process_env: bool = False) -> None:
         """
         Add configuration data from .env file.
 
+        Only the keys defined in the file are merged, so the configuration is
+        not polluted with every uppercase variable of the process environment.
+
         :param file_path: Path to .env file. If not specified, default file is used.
+        :param include_process_env: Also merge uppercase process environment
+            variables (the previous, much broader behaviour).
         """
-        # load_dotenv can work with text files, but if needed, its behavior can be modified.
-        # However, .env files are usually in UTF-8, so there should be no problems.
-        load_dotenv(dotenv_path=file_path)
-        env_vars = {key: value for key, value in os.environ.items() if key.isupper()}
+        # dotenv_values parses the file without touching os.environ and is
+        # bounded by the file size, not the size of the environment.
+        env_vars = {key: value for key, value in dotenv_values(dotenv_path=file_path).items() if value is not None}
         self._data.update(env_vars)
+        if include_process_env:
+            # Work from a snapshot so the merge is stable even if the
+            # environment is mutated concurrently.
+            process_env = os.environ.copy()
+            self._data.update({key: value for key, value in process_env.items() if key.isupper()})
 
     def get(self, key: str, value_type: type[Any] = str) -> Any:
         """
@@ -74,10 +84,13 @@ class YConfig(YNode):
         value = self._data.get(key)
         if value is None:
             raise KeyError(f"Key '{key}' not found in the configuration")
+        if type(value) is value_type:
+            # Exact type match: skip the constructor call entirely
+            return value
         try:
             return value_type(value)
         except (ValueError, TypeError):
-            raise ValueError(f"Value for key '{key}' is not of type {value_type}")
+            raise ValueError(f"Value for key '{key}' is not of type {value_type}") from None
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -146,56 +159,79 @@ class YConfig(YNode):
         :return: None. Method modifies object state by updating configuration data.
         """
         self._data = self._resolve_node(self._data)
+        # Resolution replaces values in place; drop memoized child wrappers
+        # (recursively, so held child nodes refresh too) so later reads see
+        # the resolved tree, not pre-resolution snapshots.
+        self._clear_child_caches()
 
     def _resolve_node(self, node: Any) -> Any:
-        if isinstance(node, dict):
-            return {k: self._resolve_node(v) for k, v in node.items()}
-        elif isinstance(node, list):
-            return [self._resolve_node(v) for v in node]
-        elif isinstance(node, str):
-            new_value = self._resolve_value(node)
-            while isinstance(new_value, str) and new_value != node:
-                node = new_value
-                new_value = self._resolve_value(node)
-            return new_value
+        if isinstance(node, str):
+            # Cheap substring scan: most strings carry no template at all
+            if '${{' not in node:
+                return node
+            return self._resolve_string(node)
+        elif isinstance(node, dict | list):
+            self._resolve_container(node)
+            return node
         else:
             return node
 
+    def _resolve_string(self, node: str) -> Any:
+        new_value = self._resolve_value(node)
+        while isinstance(new_value, str) and new_value != node:
+            if '${{' not in new_value:
+                return new_value
+            node = new_value
+            new_value = self._resolve_value(node)
+        return new_value
+
+    def _resolve_container(self, root: dict[str, Any] | list[Any]) -> None:
+        """
+        Resolve templates inside a dict/list tree in place.
+
+        Iterative stack walk, so deeply nested configs cannot hit the
+        interpreter recursion limit; a visited set guards against shared
+        or self-referencing containers.
+        """
+        stack: list[dict[str, Any] | list[Any]] = [root]
+        visited: set[int] = {id(root)}
+        while stack:
+            current = stack.pop()
+            items: Any = current.items() if isinstance(current, dict) else enumerate(current)
+            for key, value in list(items):
+                if isinstance(value, str):
+                    if '${{' in value:
+                        current[key] = self._resolve_string(value)
+                elif isinstance(value, dict | list):
+                    if id(value) not in visited:
+                        visited.add(id(value))
+                        stack.append(value)
+
     def _resolve_value(self, value: str) -> Any:
         match = TEMPLATE_PATTERN.fullmatch(value.strip())
         if match:
             action = match.group(1)
             params = match.group(2)
-            if action == 'env':
-                return self._handle_env(params)
-            elif action == 'file':
-                return self._handle_file(params)
-            elif action == 'config':
-                return self._handle_config(params)
-            elif action == 'yaml':
-                return self._handle_yaml(params)
-            else:
+            handler = self._HANDLERS.get(action)
+            if handler is None:
                 raise ValueError(f'Unknown action in template: {action}')
+            return handler(self, params)
         else:
             # Replace any embedded templates within the string
-            def replace_match(match: re.Match[str]) -> str:
-                action = match.group(1)
-                params = match.group(2)
-                if action == 'env':
-                    return self._handle_env(params)
-                elif action == 'file':
-                    return self._handle_file(params)
-                elif action == 'config':
-                    value = self._handle_config(params)
-                    if isinstance(value, dict | list):
-                        raise ValueError('Config template cannot return dict or list inside string.')
-                    return str(value)
-                elif action == 'yaml':
-                    raise ValueError('YAML template cannot be used inside string.')
-                else:
-                    raise ValueError(f'Unknown action in template: {action}')
-
-            return TEMPLATE_PATTERN.sub(replace_match, value)
+            return TEMPLATE_PATTERN.sub(self._replace_embedded, value)
+
+    def _replace_embedded(self, match: re.Match[str]) -> str:
+        action = match.group(1)
+        params = match.group(2)
+        if action == 'yaml':
+            raise ValueError('YAML template cannot be used inside string.')
+        handler = self._HANDLERS.get(action)
+        if handler is None:
+            raise ValueError(f'Unknown action in template: {action}')
+        value = handler(self, params)
+        if isinstance(value, dict | list):
+            raise ValueError('Config template cannot return dict or list inside string.')
+        return str(value)
 
     # Implementation of handling methods for each action
     def _handle_env(self, params: str) -> str:
@@ -216,51 +252,37 @@ class YConfig(YNode):
     def _handle_file(self, params: str) -> str:
         file_path = params.strip()
         try:
-            with open(file_path, 'rb') as f:  # Changed to binary mode
-                binary_content = f.read()
-                try:
-                    return binary_content.decode('utf-8')
-                except UnicodeDecodeError as e:
-                    raise UnicodeDecodeError(
-                        'utf-8',  # encoding
-                        binary_content,  # object
-                        e.start,  # start
-                        e.end,  # end
-                        f'Error decoding file {file_path}: {e}',
-                    ) from e
+            with open(file_path, encoding='utf-8') as f:
+                return f.read()
         except FileNotFoundError as e:
             raise FileNotFoundError(f'File not found: {file_path}') from e
 
     def _handle_config(self, params: str) -> Any:
         config_path = params.strip()
-        keys = config_path.split('.')
-        value = self._data
-        for key in keys:
-            if key not in value:
-                raise KeyError(f"Key '{config_path}' not found in configuration.")
-            value = value[key]
-        return value
+        try:
+            return _walk_parts(self._data, _split_path(config_path))
+        except KeyError:
+            raise KeyError(f"Key '{config_path}' not found in configuration.") from None
 
     def _handle_yaml(self, params: str) -> Any:
         file_path = params.strip()
         try:
-            with open(file_path, 'rb') as f:  # Changed to binary mode
-                binary_content = f.read()
-                try:
-                    text_content = binary_content.decode('utf-8')
-                except UnicodeDecodeError as e:
-                    raise UnicodeDecodeError(
-                        'utf-8',  # encoding
-                        binary_content,  # object
-                        e.start,  # start
-                        e.end,  # end
-                        f'Error decoding file {file_path}: {e}',
-                    ) from e
-                yaml_content = yaml.safe_load(text_content)
-                # After loading external YAML file, we need to process its templates as well
-                return self._resolve_node(yaml_content)
+            with open(file_path, encoding='utf-8') as f:
+                text_content = f.read()
         except FileNotFoundError as e:
             raise FileNotFoundError(f'YAML file not found: {file_path}') from e
+        yaml_content = yaml.load(text_content, Loader=_SafeLoader)  # noqa: S506
+        # After loading external YAML file, we need to process its templates as well
+        return self._resolve_node(yaml_content)
+
+    # Dispatch table for template actions; a dict lookup replaces the
+    # if/elif chain in _resolve_value.
+    _HANDLERS = {
+        'env': _handle_env,
+        'file': _handle_file,
+        'config': _handle_config,
+        'yaml': _handle_yaml,
+    }
 
 
 class YConfigFactory:
@@ -280,9 +302,11 @@ class YConfigFactory:
         :return: YNode instance.
         :raises KeyError: If key does not exist and no default instance is created.
         """
-        if key not in cls._instances:
-            raise KeyError(f"Configuration with key '{key}' not found")
-        return cls._instances[key]
+        try:
+            # Single dict lookup instead of a contains check plus index
+            return cls._instances[key]
+        except KeyError:
+            raise KeyError(f"Configuration with key '{key}' not found") from None
 
     @classmethod
     def set_config(cls, config: YConfig, key: str = 'default') -> None:
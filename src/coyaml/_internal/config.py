@@ -1,17 +1,47 @@
 # src/coyaml/_internal/config.py
 
+import copy
+import functools
 import os
 import re
+import sys
 from typing import Any
 
 import yaml
 
-from coyaml._internal.node import YNode
+try:  # Use libyaml's C loader when PyYAML is built with it (much faster parsing)
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+from coyaml._internal.node import YNode, _split_path, _walk_parts
 from coyaml.sources.base import YSource
 from coyaml.utils.merge import deep_merge
 
 # Pattern for finding variable names
-TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):(.+?)}}')
+# '[^}]+' cannot backtrack, unlike a lazy '.+?', so malformed or very
+# long strings scan in linear time.
+TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):([^}]+)}}')
+
+# Upper bound on chained template substitutions for a single string. Legit
+# configs nest a handful of levels; anything deeper is a reference cycle.
+_MAX_RESOLVE_DEPTH = 16
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_full_template(value: str) -> tuple[str, str] | None:
+    """Parse a full-string template into (action, params), cached per string.
+
+    Configs tend to repeat identical templates (the same env var referenced
+    from several keys), so repeats skip the regex entirely. Keyed on the
+    string alone — parsing depends on nothing else.
+    """
+    match = TEMPLATE_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+    # Interned action names hit the dict's pointer-comparison fast path;
+    # the handful of valid actions are already interned.
+    return sys.intern(match.group(1)), match.group(2)
 
 
 class YSettings(YNode):
@@ -21,15 +51,62 @@ class YSettings(YNode):
     Inherits from :class:`YNode`, thus supports dot notation and the ``to`` method.
     """
 
+    __slots__ = (
+        '_sources',
+        '_has_templates',
+        '_config_cache',
+        '_file_cache',
+        '_yaml_cache',
+        '_env_snapshot',
+        '_resolved',
+    )
+
+    # Keep settings bookkeeping on the instance, not inside the config data.
+    _INTERNAL_ATTRS = YNode._INTERNAL_ATTRS | {
+        '_sources',
+        '_has_templates',
+        '_config_cache',
+        '_file_cache',
+        '_yaml_cache',
+        '_env_snapshot',
+        '_resolved',
+    }
+
     def __init__(self, initial: dict[str, Any] | None = None):
         super().__init__(initial or {})
         self._sources: list[YSource] = []
+        self._has_templates: bool = self._contains_template(self._data)
+        # Memoized ${{ config:... }} lookups; valid within one resolve pass
+        self._config_cache: dict[str, Any] = {}
+        # ${{ file:... }} / ${{ yaml:... }} caches keyed by path, invalidated
+        # by file mtime so edited files are picked up on the next resolve.
+        self._file_cache: dict[str, tuple[int, str]] = {}
+        self._yaml_cache: dict[str, tuple[int, Any]] = {}
+        # Environment snapshot taken for the duration of a resolve pass;
+        # None outside of resolve_templates.
+        self._env_snapshot: dict[str, str] | None = None
+        # True after a resolve pass until the data changes again; makes
+        # repeated resolve_templates() calls no-ops.
+        self._resolved: bool = False
+        # YNode calls this hook on every data write and hands it down to
+        # child wrappers, so writes through nested nodes invalidate too.
+        self._invalidate = self._on_data_change
+
+    def _on_data_change(self, value: Any) -> None:
+        """Invalidation hook fired by writes through this object or any child node."""
+        self._config_cache.clear()
+        self._resolved = False
+        if not self._has_templates and self._contains_template(value):
+            self._has_templates = True
 
     def add_source(self, source: YSource) -> 'YSettings':
         """Load data from the source and merge it into the current object."""
         data = source.load()
         deep_merge(self._data, data)
         self._sources.append(source)
+        self._resolved = False
+        if not self._has_templates and self._contains_template(data):
+            self._has_templates = True
         return self
 
     def resolve_templates(self) -> None:
@@ -89,57 +166,153 @@ class YSettings(YNode):
 
         :return: None. Method modifies object state by updating configuration data.
         """
-        self._data = self._resolve_node(self._data)
+        # Common case: nothing in the loaded data ever contained a template
+        if not self._has_templates:
+            return
+        # Unchanged since the last pass: calling again is a no-op
+        if self._resolved:
+            return
+        self._config_cache.clear()
+        # One environment snapshot per pass: plain dict reads are cheaper
+        # than os.getenv and every env template sees a consistent view.
+        self._env_snapshot = os.environ.copy()
+        try:
+            self._data = self._resolve_node(self._data)
+        finally:
+            self._env_snapshot = None
+        # Resolution replaces values in place; drop memoized child wrappers
+        # (recursively, so held child nodes refresh too) so later reads see
+        # the resolved tree, not pre-resolution snapshots.
+        self._clear_child_caches()
+        self._resolved = True
 
     def _resolve_node(self, node: Any) -> Any:
-        if isinstance(node, dict):
-            return {k: self._resolve_node(v) for k, v in node.items()}
-        elif isinstance(node, list):
-            return [self._resolve_node(v) for v in node]
-        elif isinstance(node, str):
-            new_value = self._resolve_value(node)
-            while isinstance(new_value, str) and new_value != node:
-                node = new_value
-                new_value = self._resolve_value(node)
-            return new_value
+        if isinstance(node, str):
+            return self._resolve_string(node)
+        elif isinstance(node, dict | list):
+            self._resolve_container(node)
+            return node
         else:
             return node
 
+    def _resolve_string(self, node: str) -> Any:
+        new_value = self._resolve_value(node)
+        depth = 0
+        while isinstance(new_value, str) and new_value != node:
+            # Cheap substring scan before re-running the regex pipeline
+            if '${{' not in new_value:
+                return new_value
+            depth += 1
+            if depth > _MAX_RESOLVE_DEPTH:
+                raise ValueError(
+                    f'Template resolution exceeded {_MAX_RESOLVE_DEPTH} levels (cyclic reference?): {node}'
+                )
+            node = new_value
+            new_value = self._resolve_value(node)
+        return new_value
+
+    def _resolve_container(self, root: dict[str, Any] | list[Any]) -> None:
+        """
+        Resolve templates inside a dict/list tree in place.
+
+        The walk is iterative (no recursion limit on deep configs) and only
+        descends into subtrees that actually contain a template marker, so
+        template-free parts of the configuration are never rewritten.
+        """
+        templated = self._templated_ids(root)
+        if id(root) not in templated:
+            return
+        stack: list[dict[str, Any] | list[Any]] = [root]
+        visited: set[int] = {id(root)}
+        while stack:
+            current = stack.pop()
+            items: Any = current.items() if isinstance(current, dict) else enumerate(current)
+            for key, value in list(items):
+                if isinstance(value, str):
+                    if '${{' in value:
+                        current[key] = self._resolve_string(value)
+                elif isinstance(value, dict | list):
+                    if id(value) in templated and id(value) not in visited:
+                        visited.add(id(value))
+                        stack.append(value)
+
+    @staticmethod
+    def _contains_template(value: Any) -> bool:
+        """Return True if any string in the value (or its subtree) holds a template marker."""
+        if isinstance(value, str):
+            return '${{' in value
+        if not isinstance(value, dict | list):
+            return False
+        seen: set[int] = {id(value)}
+        stack: list[Any] = [value]
+        while stack:
+            current = stack.pop()
+            children = current.values() if isinstance(current, dict) else current
+            for child in children:
+                if isinstance(child, str):
+                    if '${{' in child:
+                        return True
+                elif isinstance(child, dict | list) and id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        return False
+
+    @staticmethod
+    def _templated_ids(root: dict[str, Any] | list[Any]) -> set[int]:
+        """
+        Return ids of containers whose subtree contains a template marker.
+
+        Single pass over the tree: containers holding a '${{' string are
+        marked directly, then marks are propagated up through parent links.
+        """
+        marked: set[int] = set()
+        parents: dict[int, list[int]] = {}
+        seen: set[int] = {id(root)}
+        stack: list[Any] = [root]
+        while stack:
+            current = stack.pop()
+            children = current.values() if isinstance(current, dict) else current
+            for child in children:
+                if isinstance(child, dict | list):
+                    parents.setdefault(id(child), []).append(id(current))
+                    if id(child) not in seen:
+                        seen.add(id(child))
+                        stack.append(child)
+                elif isinstance(child, str) and '${{' in child:
+                    marked.add(id(current))
+        pending = list(marked)
+        while pending:
+            node_id = pending.pop()
+            for parent_id in parents.get(node_id, ()):
+                if parent_id not in marked:
+                    marked.add(parent_id)
+                    pending.append(parent_id)
+        return marked
+
     def _resolve_value(self, value: str) -> Any:
-        match = TEMPLATE_PATTERN.fullmatch(value.strip())
-        if match:
-            action = match.group(1)
-            params = match.group(2)
-            if action == 'env':
-                return self._handle_env(params)
-            elif action == 'file':
-                return self._handle_file(params)
-            elif action == 'config':
-                return self._handle_config(params)
-            elif action == 'yaml':
-                return self._handle_yaml(params)
-            else:
+        parsed = _parse_full_template(value.strip())
+        if parsed is not None:
+            action, params = parsed
+            handler = self._HANDLERS.get(action)
+            if handler is None:
                 raise ValueError(f'Unknown action in template: {action}')
+            return handler(self, params)
         else:
             # Replace any embedded templates within the string
-            def replace_match(match: re.Match[str]) -> str:
-                action = match.group(1)
-                params = match.group(2)
-                if action == 'env':
-                    return self._handle_env(params)
-                elif action == 'file':
-                    return self._handle_file(params)
-                elif action == 'config':
-                    value = self._handle_config(params)
-                    if isinstance(value, dict | list):
-                        raise ValueError('Config template cannot return dict or list inside string.')
-                    return str(value)
-                elif action == 'yaml':
-                    raise ValueError('YAML template cannot be used inside string.')
-                else:
-                    raise ValueError(f'Unknown action in template: {action}')
-
-            return TEMPLATE_PATTERN.sub(replace_match, value)
+            return TEMPLATE_PATTERN.sub(self._replace_embedded, value)
+
+    def _replace_embedded(self, match: re.Match[str]) -> str:
+        action = sys.intern(match.group(1))
+        params = match.group(2)
+        if action == 'yaml':
+            raise ValueError('YAML template cannot be used inside string.')
+        handler = self._HANDLERS.get(action)
+        if handler is None:
+            raise ValueError(f'Unknown action in template: {action}')
+        value = handler(self, params)
+        if isinstance(value, dict | list):
+            raise ValueError('Config template cannot return dict or list inside string.')
+        return str(value)
 
     # Implementation of handling methods for each action
     def _handle_env(self, params: str) -> str:
@@ -152,7 +325,12 @@ class YSettings(YNode):
             var_name = params.strip()
             default_value = None
 
-        value = os.getenv(var_name, default_value)
+        env = self._env_snapshot
+        if env is not None:
+            value = env.get(var_name, default_value)
+        else:
+            # Direct _resolve_value calls outside a resolve pass
+            value = os.getenv(var_name, default_value)
         if value is None:
             raise ValueError(f'Environment variable {var_name} is not set and has no default value.')
         return value
@@ -160,48 +338,60 @@ class YSettings(YNode):
     def _handle_file(self, params: str) -> str:
         file_path = params.strip()
         try:
-            with open(file_path, 'rb') as f:  # Changed to binary mode
-                binary_content = f.read()
-                try:
-                    return binary_content.decode('utf-8')
-                except UnicodeDecodeError as e:
-                    raise UnicodeDecodeError(
-                        'utf-8',  # encoding
-                        binary_content,  # object
-                        e.start,  # start
-                        e.end,  # end
-                        f'Error decoding file {file_path}: {e}',
-                    ) from e
+            stamp = os.stat(file_path).st_mtime_ns
         except FileNotFoundError as e:
             raise FileNotFoundError(f'File not found: {file_path}') from e
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # Text mode decodes through the C-level UTF-8 path; invalid
+        # input raises UnicodeDecodeError with full context already.
+        with open(file_path, encoding='utf-8') as f:
+            content = f.read()
+        self._file_cache[file_path] = (stamp, content)
+        return content
 
     def _handle_config(self, params: str) -> Any:
         config_path = params.strip()
-        keys = config_path.split('.')
-        value = self._data
-        for key in keys:
-            if key not in value:
-                raise KeyError(f"Key '{config_path}' not found in configuration.")
-            value = value[key]
+        cache = self._config_cache
+        try:
+            return cache[config_path]
+        except KeyError:
+            pass
+        try:
+            value = _walk_parts(self._data, _split_path(config_path))
+        except KeyError:
+            raise KeyError(f"Key '{config_path}' not found in configuration.") from None
+        cache[config_path] = value
         return value
 
     def _handle_yaml(self, params: str) -> Any:
         file_path = params.strip()
         try:
-            with open(file_path, 'rb') as f:  # Changed to binary mode
-                binary_content = f.read()
-                try:
-                    text_content = binary_content.decode('utf-8')
-                except UnicodeDecodeError as e:
-                    raise UnicodeDecodeError(
-                        'utf-8',  # encoding
-                        binary_content,  # object
-                        e.start,  # start
-                        e.end,  # end
-                        f'Error decoding file {file_path}: {e}',
-                    ) from e
-                yaml_content = yaml.safe_load(text_content)
-                # After loading external YAML file, we need to process its templates as well
-                return self._resolve_node(yaml_content)
+            stamp = os.stat(file_path).st_mtime_ns
         except FileNotFoundError as e:
             raise FileNotFoundError(f'YAML file not found: {file_path}') from e
+        cached = self._yaml_cache.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            yaml_content = copy.deepcopy(cached[1])
+        else:
+            # Read as UTF-8 text so invalid input keeps raising
+            # UnicodeDecodeError; the loader then only sees text.
+            with open(file_path, encoding='utf-8') as f:
+                text_content = f.read()
+            yaml_content = yaml.load(text_content, Loader=_SafeLoader)  # noqa: S506
+            # Cache the parsed tree and hand out copies: resolution below
+            # mutates the tree in place and templates may resolve differently
+            # between passes.
+            self._yaml_cache[file_path] = (stamp, copy.deepcopy(yaml_content))
+        # After loading external YAML file, we need to process its templates as well
+        return self._resolve_node(yaml_content)
+
+    # Dispatch table for template actions; a dict lookup replaces the
+    # if/elif chain in _resolve_value.
+    _HANDLERS = {
+        'env': _handle_env,
+        'file': _handle_file,
+        'config': _handle_config,
+        'yaml': _handle_yaml,
+    }
@@ -12,7 +12,7 @@ except Exception:  # pragma: no cover
     get_type_hints_extras = get_type_hints  # fallback to stdlib
 
 
-from coyaml._internal.node import YList, YNode
+from coyaml._internal.node import YList, YNode, _split_path
 from coyaml._internal.registry import YRegistry
 from coyaml._internal.search import _dotted, _iter_tree, find_by_name, find_by_path_suffix
 
@@ -20,9 +20,148 @@ from coyaml._internal.search import _dotted, _iter_tree, find_by_name, find_by_p
 class YResource:
     """Metadata for injecting a value from :class:`YSettings`."""
 
+    __slots__ = ('path', 'config', '_parts')
+
     def __init__(self, path: str | None = None, config: str = 'default') -> None:
         self.path = path
         self.config = config
+        # Absolute paths ('^a.b.c') are looked up on every call; split once
+        self._parts = _split_path(path[1:]) if path is not None and path.startswith('^') else None
+
+
+class _PlanEntry:
+    """Precomputed injection recipe for a single parameter.
+
+    Everything derivable from the annotation alone (optionality, conversion
+    targets, whether the raw node should be passed through) is resolved at
+    decoration time so the per-call path only performs config lookups.
+    """
+
+    __slots__ = ('name', 'typ', 'resource', 'is_optional', 'default_is_none', 'wants_node')
+
+    def __init__(self, name: str, typ: Any, resource: YResource, default_is_none: bool) -> None:
+        self.name = name
+        self.typ = typ
+        self.resource = resource
+        args = get_args(typ)
+        candidates = args if args else (typ,)
+        self.is_optional = bool(args) and type(None) in args
+        self.default_is_none = default_is_none
+        self.wants_node = YNode in candidates or typ is YNode
+
+
+def _build_plan(func: Any, sig: inspect.Signature) -> list[_PlanEntry]:
+    """Inspect ``func`` once and collect injection entries for its parameters."""
+    # Use typing_extensions.get_type_hints when available to preserve Annotated extras on 3.10
+    hints = get_type_hints_extras(func, include_extras=True)
+    evaluated: dict[str, Any] | None = None
+    plan: list[_PlanEntry] = []
+    for name, param in sig.parameters.items():
+        hint = hints.get(name)
+        # Fallback: Python 3.10 get_type_hints(include_extras=True) may "lose"
+        # Annotated metadata (only base type is returned). If so, try to
+        # fetch the raw annotation directly from the signature.
+        if hint is None or get_origin(hint) is not Annotated:
+            # Fallback 1: evaluated annotations (handles future annotations)
+            if evaluated is None:
+                evaluated = inspect.get_annotations(func, eval_str=True)
+            raw = evaluated.get(name, param.annotation)
+            if get_origin(raw) is Annotated:
+                hint = raw
+
+        if hint is None or get_origin(hint) is not Annotated:
+            continue
+
+        typ, *meta = get_args(hint)
+        for m in meta:
+            if isinstance(m, YResource):
+                plan.append(_PlanEntry(name, typ, m, param.default is None))
+                break
+    return plan
+
+
+def _wrap_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return YNode(value)
+    elif isinstance(value, list):
+        return YList([YNode(v) if isinstance(v, dict) else v for v in value])
+    return value
+
+
+def _resolve_entry(entry: _PlanEntry, masks: list[str] | None, unique: bool) -> Any:
+    """Resolve the value to inject for a single precomputed plan entry."""
+    resource = entry.resource
+    cfg = YRegistry._get_config_fast(resource.config)
+    path = resource.path
+    name = entry.name
+    if path is None:
+        cfg_dict = cfg.to_dict()
+        matches = find_by_name(cfg_dict, name, masks)
+        if not matches:
+            # If Optional or default is None — return None, otherwise raise
+            if entry.is_optional or entry.default_is_none:
+                return None
+            # Gather a few similar paths containing the parameter name
+            similar_by_name: list[str] = []
+            for segs, _value in _iter_tree(cfg_dict):
+                if segs and name in segs:
+                    similar_by_name.append(_dotted(segs))
+                    if len(similar_by_name) >= 5:
+                        break
+            details = f'masks={masks!r}'
+            if similar_by_name:
+                details += '. Similar: ' + ', '.join(similar_by_name)
+            raise KeyError(f"Key by name '{name}' not found ({details})")
+
+        if len(matches) > 1 and unique:
+            listed = ', '.join(p for p, _ in matches[:5])
+            more = '...' if len(matches) > 5 else ''
+            raise KeyError(
+                f"Ambiguous key name '{name}' (masks={masks!r}): {listed}{more}. "
+                f'Specify explicit path or restrict mask.'
+            )
+
+        # Take the first candidate in deterministic order
+        _found_path, raw_value = matches[0]
+        value = _wrap_value(raw_value)
+    elif resource._parts is not None:
+        # Absolute path: walk the pre-split segments without re-parsing
+        value = cfg._get_by_parts(resource._parts)
+    else:
+        cfg_dict = cfg.to_dict()
+        matches = find_by_path_suffix(cfg_dict, path, masks)
+        if not matches:
+            # Handle Optional/default None
+            if entry.is_optional or entry.default_is_none:
+                return None
+            # Diagnostics with similar paths containing the last segment of suffix
+            segs = path.split('.')
+            last = segs[-1] if segs else ''
+            similar_by_suffix: list[str] = []
+            for seg_path, _value in _iter_tree(cfg_dict):
+                if seg_path and last in seg_path:
+                    similar_by_suffix.append(_dotted(seg_path))
+                    if len(similar_by_suffix) >= 5:
+                        break
+            details = f"path='{path}', masks={masks!r}"
+            if similar_by_suffix:
+                details += '. Similar: ' + ', '.join(similar_by_suffix)
+            raise KeyError(f'Key by relative path suffix not found ({details})')
+
+        if len(matches) > 1 and unique:
+            listed = ', '.join(p for p, _ in matches[:5])
+            more = '...' if len(matches) > 5 else ''
+            raise KeyError(
+                f"Ambiguous relative path suffix '{path}' (masks={masks!r}): {listed}{more}. "
+                f'Specify absolute path (^prefix) or restrict mask.'
+            )
+
+        _found_path, raw_value = matches[0]
+        value = _wrap_value(raw_value)
+    if isinstance(value, YNode | YList) and not entry.wants_node:
+        # Convert unless the annotation explicitly asks for the raw node
+        value = value.to(entry.typ)
+    return value
 
 
 def coyaml(_func=None, *, mask: str | list[str] | None = None, unique: bool = True):  # type: ignore
@@ -36,145 +175,34 @@ def coyaml(_func=None, *, mask: str | list[str] | None = None, unique: bool = Tr
         def g(...): ...
     """
 
-    decorator_mask = mask
+    decorator_masks = [mask] if isinstance(mask, str) else (mask or None)
     decorator_unique = unique
 
     def _decorate(func: Any) -> Any:
-        # Use typing_extensions.get_type_hints when available to preserve Annotated extras on 3.10
-        hints = get_type_hints_extras(func, include_extras=True)
-        sig = inspect.signature(func)
+        # Built lazily on first call: get_type_hints/signature may import
+        # annotation modules and evaluate forward references, which would
+        # otherwise slow down module import for handlers that are never
+        # invoked. A concurrent first call would merely rebuild the same
+        # plan, so no locking is needed.
+        sig: inspect.Signature | None = None
+        plan: list[_PlanEntry] | None = None
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal sig, plan
+            if plan is None or sig is None:
+                sig = inspect.signature(func)
+                plan = _build_plan(func, sig)
+            if not args and not kwargs:
+                # Common case for decorated handlers: every argument is
+                # injected, so skip the inspect.bind_partial machinery.
+                injected = {entry.name: _resolve_entry(entry, decorator_masks, decorator_unique) for entry in plan}
+                return func(**injected)
             bound = sig.bind_partial(*args, **kwargs)
-            for name, _param in sig.parameters.items():
-                if name in bound.arguments:
-                    continue
-
-                hint = hints.get(name)
-                # Fallback: Python 3.10 get_type_hints(include_extras=True) may "lose"
-                # Annotated metadata (only base type is returned). If so, try to
-                # fetch the raw annotation directly from the signature.
-                if hint is None or get_origin(hint) is not Annotated:
-                    # Fallback 1: evaluated annotations (handles future annotations)
-                    evaluated = inspect.get_annotations(func, eval_str=True)
-                    raw = evaluated.get(name, _param.annotation)
-                    if get_origin(raw) is Annotated:
-                        hint = raw
-
-                if hint is None:
-                    continue
-
-                if get_origin(hint) is Annotated:
-                    typ, *meta = get_args(hint)
-                    for m in meta:
-                        if isinstance(m, YResource):
-                            cfg = YRegistry.get_config(m.config)
-                            path = m.path
-                            if path is None:
-                                masks = (
-                                    [decorator_mask] if isinstance(decorator_mask, str) else (decorator_mask or None)
-                                )
-                                cfg_dict = cfg.to_dict()
-                                matches = find_by_name(cfg_dict, name, masks)
-                                if not matches:
-                                    # If Optional or default is None — return None, otherwise raise
-                                    is_optional = False
-                                    args = get_args(typ)
-                                    if args and type(None) in args:
-                                        is_optional = True
-                                    default_is_none = name in sig.parameters and sig.parameters[name].default is None
-                                    if is_optional or default_is_none:
-                                        bound.arguments[name] = None
-                                        break
-                                    # Gather a few similar paths containing the parameter name
-                                    similar_by_name: list[str] = []
-                                    for segs, _value in _iter_tree(cfg_dict):
-                                        if segs and name in segs:
-                                            similar_by_name.append(_dotted(segs))
-                                            if len(similar_by_name) >= 5:
-                                                break
-                                    details = f'masks={masks!r}'
-                                    if similar_by_name:
-                                        details += '. Similar: ' + ', '.join(similar_by_name)
-                                    raise KeyError(f"Key by name '{name}' not found ({details})")
-
-                                if len(matches) > 1 and decorator_unique:
-                                    listed = ', '.join(p for p, _ in matches[:5])
-                                    more = '...' if len(matches) > 5 else ''
-                                    raise KeyError(
-                                        f"Ambiguous key name '{name}' (masks={masks!r}): {listed}{more}. "
-                                        f'Specify explicit path or restrict mask.'
-                                    )
-
-                                # Take the first candidate in deterministic order
-                                found_path, raw_value = matches[0]
-                                value = raw_value
-                                if isinstance(value, dict):
-                                    value = YNode(value)
-                                elif isinstance(value, list):
-                                    value = YList([YNode(v) if isinstance(v, dict) else v for v in value])
-                            else:
-                                # If path is provided, support relative suffix lookup unless absolute
-                                masks = (
-                                    [decorator_mask] if isinstance(decorator_mask, str) else (decorator_mask or None)
-                                )
-                                if path.startswith('^'):
-                                    absolute = path[1:]
-                                    value = cfg[absolute]
-                                else:
-                                    cfg_dict = cfg.to_dict()
-                                    matches = find_by_path_suffix(cfg_dict, path, masks)
-                                    if not matches:
-                                        # Handle Optional/default None
-                                        is_optional = False
-                                        args = get_args(typ)
-                                        if args and type(None) in args:
-                                            is_optional = True
-                                        default_is_none = (
-                                            name in sig.parameters and sig.parameters[name].default is None
-                                        )
-                                        if is_optional or default_is_none:
-                                            bound.arguments[name] = None
-                                            break
-                                        # Diagnostics with similar paths containing the last segment of suffix
-                                        segs = path.split('.')
-                                        last = segs[-1] if segs else ''
-                                        cfg_dict2 = cfg.to_dict()
-                                        similar_by_suffix: list[str] = []
-                                        for seg_path, _value in _iter_tree(cfg_dict2):
-                                            if seg_path and last in seg_path:
-                                                similar_by_suffix.append(_dotted(seg_path))
-                                                if len(similar_by_suffix) >= 5:
-                                                    break
-                                        details = f"path='{path}', masks={masks!r}"
-                                        if similar_by_suffix:
-                                            details += '. Similar: ' + ', '.join(similar_by_suffix)
-                                        raise KeyError(f'Key by relative path suffix not found ({details})')
-
-                                    if len(matches) > 1 and decorator_unique:
-                                        listed = ', '.join(p for p, _ in matches[:5])
-                                        more = '...' if len(matches) > 5 else ''
-                                        raise KeyError(
-                                            f"Ambiguous relative path suffix '{path}' (masks={masks!r}): {listed}{more}. "
-                                            f'Specify absolute path (^prefix) or restrict mask.'
-                                        )
-
-                                    found_path, raw_value = matches[0]
-                                    value = raw_value
-                                    if isinstance(value, dict):
-                                        value = YNode(value)
-                                    elif isinstance(value, list):
-                                        value = YList([YNode(v) if isinstance(v, dict) else v for v in value])
-                            if isinstance(value, YNode | YList):
-                                # Конвертируем во всё, что не включает YNode
-                                candidates = get_args(typ) if get_args(typ) else (typ,)
-                                if YNode in candidates or typ is YNode:
-                                    pass
-                                else:
-                                    value = value.to(typ)
-                            bound.arguments[name] = value
-                            break
+            arguments = bound.arguments
+            for entry in plan:
+                if entry.name not in arguments:
+                    arguments[entry.name] = _resolve_entry(entry, decorator_masks, decorator_unique)
             return func(*bound.args, **bound.kwargs)
 
         return wrapper
@@ -1,5 +1,7 @@
+import functools
 import importlib
 import re
+import sys
 from collections.abc import Iterator
 from typing import (
     Any,
@@ -9,12 +11,56 @@ from typing import (
 from pydantic import TypeAdapter
 
 # Pattern for finding variable names
-TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):(.+?)}}')
+# '[^}]+' cannot backtrack, unlike a lazy '.+?', so malformed or very
+# long strings scan in linear time.
+TEMPLATE_PATTERN = re.compile(r'\${{\s*(\w+):([^}]+)}}')
 
 
 # Define type variable
 T = TypeVar('T')
 
+# Exact types that never need wrapping; checked by identity before the
+# costlier isinstance cascade in YNode._convert_value.
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(item: str) -> tuple[str, ...]:
+    """Split a dotted path into an interned key tuple, cached per path string.
+
+    Interned keys hit CPython's dict fast path (pointer comparison before
+    hash comparison), and the LRU cache avoids re-splitting hot paths that
+    are accessed repeatedly during template resolution and injection.
+    """
+    return tuple(sys.intern(k) for k in item.split('.'))
+
+
+@functools.lru_cache(maxsize=256)
+def _import_string(target: str) -> Any:
+    """Resolve a 'package.module.ClassName' string to the class, cached.
+
+    Repeated conversions with the same string target (common when configs
+    are re-validated in a loop) skip the import machinery and getattr.
+    """
+    module_name, class_name = target.rsplit('.', 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def _walk_parts(value: Any, keys: tuple[str, ...]) -> Any:
+    """Descend pre-split path segments with a single lookup per level.
+
+    EAFP: TypeError covers descending into a non-dict value. Raises a bare
+    KeyError carrying the failing segment; callers attach their own
+    context-appropriate message.
+    """
+    try:
+        for key in keys:
+            value = value[key]
+    except (KeyError, TypeError):
+        raise KeyError(key) from None
+    return value
+
 
 class YList(list[Any]):
     """
@@ -23,11 +69,11 @@ class YList(list[Any]):
     list[int], dict[str, Model] if applied to list of dicts via YNode.to()).
     """
 
+    __slots__ = ()
+
     def to(self, target_type: type[T] | str) -> T:
         if isinstance(target_type, str):
-            module_name, class_name = target_type.rsplit('.', 1)
-            module = importlib.import_module(module_name)
-            model_type: type[T] = getattr(module, class_name)
+            model_type: type[T] = _import_string(target_type)
         else:
             model_type = target_type
 
@@ -43,6 +89,14 @@ class YNode:
     Allows accessing nested configuration parameters through attributes and keys.
     """
 
+    # No per-instance __dict__: configs hold thousands of nodes, and slots
+    # both shrink them and speed up access to the internal attributes.
+    __slots__ = ('_data', '_child_cache', '_invalidate')
+
+    # Attribute names stored on the instance itself; everything else written
+    # through __setattr__ goes into the configuration data.
+    _INTERNAL_ATTRS = frozenset({'_data', '_child_cache', '_invalidate'})
+
     def __init__(self, data: dict[str, Any]):
         """
         Initialize a configuration node.
@@ -50,6 +104,14 @@ class YNode:
         :param data: Dictionary with configuration data.
         """
         self._data = data
+        # Wrapper cache keyed by id() of the child container. Entries store
+        # (raw child, wrapper): the raw reference pins the child's id
+        # against recycling, and hits verify identity before returning.
+        # Mutating children through the raw dict bypasses this cache.
+        self._child_cache: dict[int, tuple[Any, Any]] = {}
+        # Invalidation hook shared with child wrappers; settings roots set
+        # it so writes through nested nodes reach the root's bookkeeping.
+        self._invalidate: Any = None
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -69,6 +131,12 @@ class YNode:
         """
         return self._data.items()  # type: ignore
 
+    def keys(self) -> Any:
+        """
+        Allow iteration over configuration keys, like in a dictionary.
+        """
+        return self._data.keys()
+
     def values(self) -> Any:
         """
         Allow iteration over configuration values.
@@ -83,14 +151,11 @@ class YNode:
         :return: Parameter value or a new configuration node if the parameter is a dictionary.
         :raises AttributeError: If the parameter is not found.
         """
-        if item not in self._data:
-            raise AttributeError(f"'YNode' object has no attribute '{item}'")
-        value = self._data[item]
-        if isinstance(value, dict):
-            return YNode(value)
-        elif isinstance(value, list):
-            return YList([YNode(v) if isinstance(v, dict) else v for v in value])
-        return value
+        try:
+            value = self._data[item]
+        except KeyError:
+            raise AttributeError(f"'YNode' object has no attribute '{item}'") from None
+        return self._wrap_child(value)
 
     def __getitem__(self, item: str) -> Any:
         """
@@ -100,20 +165,78 @@ class YNode:
         :return: Parameter value.
         :raises KeyError: If the parameter is not found.
         """
-        keys = item.split('.')
-        value = self._data
+        return self._get_by_parts(_split_path(item))
 
-        for key in keys:
-            if not isinstance(value, dict) or key not in value:
-                raise KeyError(f"Key '{key}' not found in the configuration")
-            value = value[key]
+    def _get_by_parts(self, keys: tuple[str, ...]) -> Any:
+        """
+        Look up a value by pre-split path segments.
+
+        Lets callers that resolve the same path repeatedly (e.g. injection
+        metadata) split it once instead of on every access.
+
+        :param keys: Path segments, as produced by :func:`_split_path`.
+        :return: Parameter value.
+        :raises KeyError: If the parameter is not found.
+        """
+        try:
+            value = _walk_parts(self._data, keys)
+        except KeyError as e:
+            raise KeyError(f"Key '{e.args[0]}' not found in the configuration") from None
+
+        return self._wrap_child(value)
+
+    def _wrap_child(self, value: Any) -> Any:
+        """
+        Wrap a child dictionary or list, memoizing the wrapper so repeated
+        access to the same subtree does not allocate a new one each time.
+
+        Note that YList wrappers are snapshots of the raw list: elements
+        replaced in the raw list afterwards are not reflected in a cached
+        wrapper.
 
+        :param value: Raw child value from the configuration data.
+        :return: Wrapped value (or the value itself for scalars).
+        """
         if isinstance(value, dict):
-            return YNode(value)
+            entry = self._child_cache.get(id(value))
+            if entry is not None and entry[0] is value:
+                return entry[1]
+            node = self._new_node(value)
+            self._child_cache[id(value)] = (value, node)
+            return node
         elif isinstance(value, list):
-            return YList([YNode(v) if isinstance(v, dict) else v for v in value])
+            entry = self._child_cache.get(id(value))
+            if entry is not None and entry[0] is value:
+                return entry[1]
+            wrapped = YList([self._new_node(v) if isinstance(v, dict) else v for v in value])
+            self._child_cache[id(value)] = (value, wrapped)
+            return wrapped
         return value
 
+    def _new_node(self, data: dict[str, Any]) -> 'YNode':
+        """Create a child node sharing this node's invalidation hook."""
+        node = YNode(data)
+        node._invalidate = self._invalidate
+        return node
+
+    def _clear_child_caches(self) -> None:
+        """
+        Drop memoized child wrappers, recursively through cached nodes.
+
+        Used after in-place template resolution: cached YList wrappers are
+        snapshots of pre-resolution values, including wrappers reachable
+        only through previously returned child nodes.
+        """
+        stack: list[YNode] = [self]
+        seen: set[int] = {id(self)}
+        while stack:
+            node = stack.pop()
+            for _raw, wrapper in node._child_cache.values():
+                if isinstance(wrapper, YNode) and id(wrapper) not in seen:
+                    seen.add(id(wrapper))
+                    stack.append(wrapper)
+            node._child_cache.clear()
+
     def __setattr__(self, key: str, value: Any) -> None:
         """
         Set a configuration parameter value through attributes.
@@ -121,10 +244,12 @@ class YNode:
         :param key: Parameter name.
         :param value: Parameter value.
         """
-        if key == '_data':  # Exception for internal attribute
+        if key in self._INTERNAL_ATTRS:  # Exception for internal attributes
             super().__setattr__(key, value)
         else:
             self._data[key] = self._convert_value(value)
+            if self._invalidate is not None:
+                self._invalidate(value)
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -134,15 +259,19 @@ class YNode:
         :param key: Parameter name or chain of parameters separated by dots.
         :param value: Parameter value.
         """
-        keys = key.split('.')
+        keys = _split_path(key)
         d = self._data
 
         for k in keys[:-1]:
-            if k not in d or not isinstance(d[k], dict):
-                d[k] = {}
-            d = d[k]
+            nxt = d.get(k)
+            if not isinstance(nxt, dict):
+                nxt = {}
+                d[k] = nxt
+            d = nxt
 
         d[keys[-1]] = self._convert_value(value)
+        if self._invalidate is not None:
+            self._invalidate(value)
 
     def to(self, model: type[T] | str) -> T:
         """
@@ -152,9 +281,7 @@ class YNode:
         :return: Model instance initialized with configuration data.
         """
         if isinstance(model, str):
-            module_name, class_name = model.rsplit('.', 1)
-            module = importlib.import_module(module_name)
-            model_type: type[T] = getattr(module, class_name)
+            model_type: type[T] = _import_string(model)
         else:
             model_type = model
 
@@ -169,27 +296,34 @@ class YNode:
         :param value: Value to convert.
         :return: Converted value.
         """
+        if type(value) in _SCALAR_TYPES:
+            return value
         if isinstance(value, dict):
-            return YNode(value)
+            return self._new_node(value)
         elif isinstance(value, list):
-            return YList([YNode(item) if isinstance(item, dict) else item for item in value])
+            return YList([self._new_node(item) if isinstance(item, dict) else item for item in value])
         return value
 
-    def __eq__(self, other: Any) -> bool:
+    def __eq__(self, other: Any) -> Any:
         """
         Compare YNode with another object.
         Supports comparison with dictionaries and lists.
 
+        Returns ``NotImplemented`` for other types so Python can ask the
+        other operand (e.g. ``dict == YNode`` also works).
+
         :param other: Object to compare with.
         :return: True if objects are equal.
         """
         if isinstance(other, YNode):
             return self._data == other._data
-        elif isinstance(other, dict):
+        t = type(other)
+        if t is dict or t is list:
             return self._data == other
-        elif isinstance(other, list):
-            return self._data == other
-        return False
+        return NotImplemented
+
+    # Nodes are mutable views over the configuration data
+    __hash__ = None  # type: ignore[assignment]
 
     def __repr__(self) -> str:
         """
@@ -59,9 +59,23 @@ class YRegistry:
             KeyError if config not found.
         """
         with cls._lock:
-            if key not in cls._instances:
-                raise KeyError(f"Config '{key}' not found")
-            return cls._instances[key]
+            try:
+                return cls._instances[key]
+            except KeyError:
+                raise KeyError(f"Config '{key}' not found") from None
+
+    @classmethod
+    def _get_config_fast(cls, key: str) -> YSettings:
+        """
+        Lock-free hot-path lookup used by the injection wrapper.
+
+        A plain dict read is atomic under the GIL; fall back to get_config
+        for the locked path and its error message when the key is missing.
+        """
+        cfg = cls._instances.get(key)
+        if cfg is not None:
+            return cfg
+        return cls.get_config(key)
 
     @classmethod
     def create_from_uri_list(
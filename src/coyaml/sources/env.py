@@ -17,4 +17,6 @@ class EnvFileSource(YSource):
     def load(self) -> dict[str, Any]:
         if self.file_path:
             load_dotenv(self.file_path)
-        return dict(os.environ.items())
+        # Snapshot in one C-level call instead of iterating items(); also
+        # keeps the result stable if the environment mutates concurrently.
+        return os.environ.copy()
@@ -1,10 +1,33 @@
+import copy
+import functools
+import os
 from typing import Any
 
 import yaml
 
+try:  # Use libyaml's C loader when PyYAML is built with it (much faster parsing)
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from coyaml.sources.base import YSource
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_file(file_path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    """Parse a YAML file, cached per (path, mtime_ns, size).
+
+    The stat fields key the cache so an edited file is re-parsed; callers
+    must deep-copy the result before mutating it. Decode and parse errors
+    propagate — lru_cache does not cache raised exceptions.
+    """
+    # Text mode decodes through the io layer's C-level UTF-8 path and
+    # raises UnicodeDecodeError itself on invalid input, so no manual
+    # decode-and-rewrap step is needed.
+    with open(file_path, encoding='utf-8') as file:
+        return yaml.load(file.read(), Loader=_SafeLoader)  # noqa: S506
+
+
 class YamlFileSource(YSource):
     """
     Source for loading YAML file.
@@ -19,17 +42,27 @@ class YamlFileSource(YSource):
 
         :param file_path: Path to YAML file.
         """
-        with open(self.file_path, 'rb') as file:  # Changed to binary mode for better encoding support
-            binary_content = file.read()
-            try:
-                text_content = binary_content.decode('utf-8')
-            except UnicodeDecodeError as e:
-                raise UnicodeDecodeError(
-                    'utf-8',  # encoding
-                    binary_content,  # object
-                    e.start,  # start
-                    e.end,  # end
-                    f'Error decoding file {self.file_path}: {e}',
-                ) from e
-            config = yaml.safe_load(text_content)
-            return config
+        stat = os.stat(self.file_path)
+        config = _parse_yaml_file(self.file_path, stat.st_mtime_ns, stat.st_size)
+        # Hand out a copy: the settings object merges and resolves in place,
+        # which must not corrupt the cached tree.
+        return copy.deepcopy(config)
+
+
+class YamlStringSource(YSource):
+    """
+    Source for loading YAML from an in-memory string.
+
+    Useful for tests and for configuration received from the network:
+    same loading semantics as :class:`YamlFileSource`, without the file
+    round-trip.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def load(self) -> dict[str, Any]:
+        """
+        Parse the YAML string and return configuration data.
+        """
+        return yaml.load(self.content, Loader=_SafeLoader)  # noqa: S506
@@ -0,0 +1,25 @@
+# tests/conftest.py
+import copy
+from typing import Any
+
+import pytest
+import yaml
+
+from coyaml import YSettings
+
+
+@pytest.fixture(scope='session')
+def config_yaml_data() -> dict[str, Any]:
+    """Parse tests/config/config.yaml once per session.
+
+    YAML parsing dominates the cost of most tests here; tests that just
+    need the loaded data share this parse and work on deep copies.
+    """
+    with open('tests/config/config.yaml', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture
+def config(config_yaml_data: dict[str, Any]) -> YSettings:
+    """Fresh YSettings over a deep copy of the parsed config.yaml data."""
+    return YSettings(copy.deepcopy(config_yaml_data))